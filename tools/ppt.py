@@ -17,6 +17,50 @@ from pptx.enum.shapes import PP_PLACEHOLDER
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
+# Markdown extensions used for slides that may contain code blocks
+_MD_EXTENSIONS = (
+    'markdown.extensions.tables',
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.codehilite',
+    'markdown.extensions.nl2br',
+    'markdown.extensions.sane_lists',
+)
+
+# Extensions for text-only slides: skips fenced_code and codehilite (Pygments)
+_MD_LIGHT_EXTENSIONS = (
+    'markdown.extensions.tables',
+    'markdown.extensions.nl2br',
+    'markdown.extensions.sane_lists',
+)
+
+# Substrings that indicate a fenced or indented code block may be present
+_CODE_MARKERS = ('```', '~~~', '\n    ', '\n\t')
+
+# Slide separator: a line of three or more dashes
+_SEP_RE = re.compile(r'\n-{3,}\n')
+
+# DrawingML tags used for paragraph bullet formatting
+_A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+_BU_NONE_TAG = f'{{{_A_NS}}}buNone'
+_BU_CHAR_TAG = f'{{{_A_NS}}}buChar'
+_BU_AUTO_NUM_TAG = f'{{{_A_NS}}}buAutoNum'
+_BULLET_TAGS = frozenset([_BU_NONE_TAG, _BU_CHAR_TAG, _BU_AUTO_NUM_TAG])
+
+# Fallback textbox geometry used when a slide has no body placeholder
+_TEXTBOX_LEFT = Inches(1)
+_TEXTBOX_TOP = Inches(2)
+_TEXTBOX_WIDTH = Inches(8)
+_TEXTBOX_HEIGHT = Inches(4)
+
+# Font size for code blocks
+_CODE_FONT_SIZE = Pt(10)
+
+# Font sizes for subheadings rendered inside a slide body
+_SUBHEADING_SIZES = {'h3': Pt(18), 'h4': Pt(16), 'h5': Pt(14), 'h6': Pt(12)}
+
+# Tags that can start or contribute to a slide when grouping by headings
+_SLIDE_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'pre', 'code', 'table'])
+
 class PptTool(Tool):
     def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage]:
         # Get markdown content from parameters
@@ -54,6 +98,9 @@ class PptTool(Tool):
         # Create a new presentation with optional template
         prs = self._create_presentation(theme)
         
+        # Placeholder idx per (slide layout, placeholder type), filled in lazily by _get_placeholder
+        self._layout_placeholder_idx: Dict[tuple, Optional[int]] = {}
+        
         # Check if the content has slide separators (---)
         if self._has_slide_separators(md_content):
             # Process markdown with slide separators
@@ -61,19 +108,10 @@ class PptTool(Tool):
         else:
             # Process markdown without separators (using headers as slide dividers)
             # Convert markdown to HTML with extensions
-            html_content = markdown.markdown(
-                md_content,
-                extensions=[
-                    'markdown.extensions.tables',
-                    'markdown.extensions.fenced_code',
-                    'markdown.extensions.codehilite',
-                    'markdown.extensions.nl2br',
-                    'markdown.extensions.sane_lists'
-                ]
-            )
+            html_content = self._get_md(md_content).reset().convert(md_content)
             
             # Parse HTML content
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = self._parse_html(html_content)
             
             # Check if presentation metadata is included
             metadata = self._extract_metadata(md_content)
@@ -82,38 +120,46 @@ class PptTool(Tool):
             self._create_slides_from_html(prs, soup, title, metadata)
             
             # Save presentation to a bytes buffer
-            pptx_bytes = io.BytesIO()
-            prs.save(pptx_bytes)
-            pptx_bytes.seek(0)
-            
-            return pptx_bytes.getvalue()
+            buf = io.BytesIO()
+            prs.save(buf)
+            return buf.getvalue()
+    
+    def _get_md(self, md_content: str) -> markdown.Markdown:
+        """Return the cached Markdown converter suited to the content, creating it on first use"""
+        # Code highlighting is only needed when the text may contain code blocks
+        has_code = md_content.startswith(('    ', '\t')) or any(marker in md_content for marker in _CODE_MARKERS)
+        attr = "_md_full" if has_code else "_md_light"
+        md = getattr(self, attr, None)
+        if md is None:
+            md = markdown.Markdown(extensions=_MD_EXTENSIONS if has_code else _MD_LIGHT_EXTENSIONS)
+            setattr(self, attr, md)
+        return md
+    
+    def _parse_html(self, html_content: str):
+        """Parse converted HTML with lxml and return the fragment root"""
+        soup = BeautifulSoup(html_content, 'lxml')
+        # lxml wraps fragments in <html><body>; hand back the body so its
+        # children are the top-level markdown blocks
+        return soup.body or soup
     
     def _has_slide_separators(self, md_content: str) -> bool:
         """Check if the markdown content uses slide separators (---)"""
         # Look for patterns like \n---\n which indicate slide separators
-        return bool(re.search(r'\n-{3,}\n', md_content))
+        # (plain substring check first, regex only for longer dash runs)
+        return '\n---\n' in md_content or bool(_SEP_RE.search(md_content))
     
     def _process_with_separators(self, md_content: str, title: str, prs: Presentation) -> bytes:
         """Process markdown content that uses slide separators"""
-        # Split content by slide separators
-        slide_contents = re.split(r'\n-{3,}\n', md_content)
+        # Split content by slide separators, one slide at a time
+        slide_contents = self._iter_slide_contents(md_content)
+        first_slide_content = next(slide_contents)
         
         # Extract metadata from the first slide if any
-        metadata = self._extract_metadata(slide_contents[0] if slide_contents else "")
+        metadata = self._extract_metadata(first_slide_content)
         
         # Create title slide from the first content block
-        first_slide_content = slide_contents[0] if slide_contents else ""
-        html_content = markdown.markdown(
-            first_slide_content,
-            extensions=[
-                'markdown.extensions.tables',
-                'markdown.extensions.fenced_code',
-                'markdown.extensions.codehilite',
-                'markdown.extensions.nl2br',
-                'markdown.extensions.sane_lists'
-            ]
-        )
-        soup = BeautifulSoup(html_content, 'html.parser')
+        html_content = self._get_md(first_slide_content).reset().convert(first_slide_content)
+        soup = self._parse_html(html_content)
         
         # Find main title (h1) if any
         main_title = title
@@ -121,40 +167,13 @@ class PptTool(Tool):
         if h1_tag:
             main_title = h1_tag.get_text().strip()
             # Remove h1 from content since it will be in the title
-            h1_tag.decompose()
+            h1_tag.extract()
         
-        # Create title slide
-        title_slide_layout = prs.slide_layouts[0]
-        title_slide = prs.slides.add_slide(title_slide_layout)
+        # Create title slide, taking the subtitle from h2 if any
+        title_slide = self._build_title_slide(prs, main_title, metadata, soup)
         
-        # Set the title
-        title_shape = title_slide.shapes.title
-        title_shape.text = main_title
-        
-        # Set subtitle if available
-        if len(title_slide.placeholders) > 1:
-            try:
-                subtitle = title_slide.placeholders[1]
-                h2_tag = soup.find('h2')
-                if h2_tag:
-                    subtitle.text = h2_tag.get_text().strip()
-                    # Remove h2 from content since it will be in subtitle
-                    h2_tag.decompose()
-                else:
-                    author = metadata.get("author", "")
-                    date = metadata.get("date", "")
-                    
-                    if author and date:
-                        subtitle.text = f"{author} | {date}"
-                    elif author:
-                        subtitle.text = author
-                    elif date:
-                        subtitle.text = date
-            except (IndexError, KeyError):
-                pass
-                
         # Process any remaining content in the first slide (like bullet points)
-        remaining_content = list(soup.children)
+        remaining_content = soup.contents  # the tag's own child list, not a copy
         if remaining_content:
             # Find a suitable body placeholder in title slide
             body_shape = self._find_body_shape(title_slide)
@@ -162,25 +181,16 @@ class PptTool(Tool):
                 self._add_content_to_slide(body_shape, remaining_content)
         
         # Process remaining slides
-        for slide_content in slide_contents[1:]:
+        for slide_content in slide_contents:
             # Skip empty slides
             if not slide_content.strip():
                 continue
                 
             # Convert slide content to HTML
-            html_content = markdown.markdown(
-                slide_content,
-                extensions=[
-                    'markdown.extensions.tables',
-                    'markdown.extensions.fenced_code',
-                    'markdown.extensions.codehilite',
-                    'markdown.extensions.nl2br',
-                    'markdown.extensions.sane_lists'
-                ]
-            )
+            html_content = self._get_md(slide_content).reset().convert(slide_content)
             
             # Parse HTML
-            slide_soup = BeautifulSoup(html_content, 'html.parser')
+            slide_soup = self._parse_html(html_content)
             
             # Determine slide layout and title
             slide_title = ""
@@ -189,10 +199,10 @@ class PptTool(Tool):
             
             if h1_tag:
                 slide_title = h1_tag.get_text().strip()
-                h1_tag.decompose()  # Remove from content as it will be the slide title
+                h1_tag.extract()  # Remove from content as it will be the slide title
             elif h2_tag:
                 slide_title = h2_tag.get_text().strip()
-                h2_tag.decompose()  # Remove from content as it will be the slide title
+                h2_tag.extract()  # Remove from content as it will be the slide title
             
             # Determine slide layout
             has_table = bool(slide_soup.find('table'))
@@ -208,44 +218,72 @@ class PptTool(Tool):
             slide = prs.slides.add_slide(slide_layout)
             
             # Set slide title
-            if slide.shapes.title:
-                slide.shapes.title.text = slide_title
+            title_shape = slide.shapes.title
+            if title_shape:
+                title_shape.text = slide_title
             
-            # Get all remaining content elements
-            content_elements = list(slide_soup.children)
+            # Get all remaining content elements (the tag's own child list, not a copy)
+            content_elements = slide_soup.contents
             
             # Add content if there are any elements left
             if content_elements:
-                try:
-                    # Find a suitable content placeholder - first try body placeholder
-                    body_shape = self._find_body_shape(slide)
-                    
-                    if body_shape:
-                        self._add_content_to_slide(body_shape, content_elements)
-                    else:
-                        # If no body placeholder found, create a textbox
-                        left = Inches(1)
-                        top = Inches(2)
-                        width = Inches(8)
-                        height = Inches(4)
-                        textbox = slide.shapes.add_textbox(left, top, width, height)
-                        self._add_content_to_slide(textbox, content_elements)
-                        
-                except Exception as e:
-                    # If there's a problem, create a textbox and try again
-                    left = Inches(1)
-                    top = Inches(2)
-                    width = Inches(8)
-                    height = Inches(4)
-                    textbox = slide.shapes.add_textbox(left, top, width, height)
-                    self._add_content_to_slide(textbox, content_elements)
+                self._add_content_to_slide(self._place_content(slide), content_elements)
         
         # Save presentation to a bytes buffer
-        pptx_bytes = io.BytesIO()
-        prs.save(pptx_bytes)
-        pptx_bytes.seek(0)
+        buf = io.BytesIO()
+        prs.save(buf)
+        return buf.getvalue()
+    
+    def _iter_slide_contents(self, md_content: str):
+        """Yield the markdown of each slide between separators, like re.split but lazily"""
+        start = 0
+        for match in _SEP_RE.finditer(md_content):
+            yield md_content[start:match.start()]
+            start = match.end()
+        yield md_content[start:]
+    
+    def _build_title_slide(self, prs: Presentation, main_title: str, metadata: Dict[str, Any], soup=None):
+        """Create the title slide, with a subtitle from an h2 in soup or from metadata"""
+        title_slide = prs.slides.add_slide(prs.slide_layouts[0])  # Title slide layout
+        
+        # Set the title
+        title_slide.shapes.title.text = main_title
         
-        return pptx_bytes.getvalue()
+        # Try to set subtitle if the slide has a subtitle placeholder
+        if len(title_slide.placeholders) > 1:
+            try:
+                subtitle = title_slide.placeholders[1]  # Index 1 is typically the subtitle
+                h2_tag = soup.find('h2') if soup is not None else None
+                if h2_tag:
+                    subtitle.text = h2_tag.get_text().strip()
+                    # Remove h2 from content since it will be in subtitle
+                    h2_tag.extract()
+                else:
+                    subtitle_text = self._subtitle_text(metadata)
+                    if subtitle_text:
+                        subtitle.text = subtitle_text
+            except (IndexError, KeyError):
+                pass
+        
+        return title_slide
+    
+    def _subtitle_text(self, metadata: Dict[str, Any]) -> str:
+        """Build the title slide subtitle from author and date metadata"""
+        return " | ".join(filter(None, [metadata.get("author", ""), metadata.get("date", "")]))
+    
+    def _place_content(self, slide):
+        """Return the shape that should hold the slide's content"""
+        try:
+            # Find a suitable content placeholder - first try body placeholder
+            body_shape = self._find_body_shape(slide)
+        except (KeyError, IndexError, AttributeError):
+            body_shape = None
+        
+        if body_shape:
+            return body_shape
+        
+        # If no body placeholder found, create a textbox
+        return slide.shapes.add_textbox(_TEXTBOX_LEFT, _TEXTBOX_TOP, _TEXTBOX_WIDTH, _TEXTBOX_HEIGHT)
     
     def _find_body_shape(self, slide):
         """Find the body shape in a slide (content placeholder)"""
@@ -263,14 +301,17 @@ class PptTool(Tool):
             except (IndexError, KeyError):
                 pass
                 
+        # Look up the title once; proxies compare equal by their XML element
+        title_shape = slide.shapes.title
+        
         # As a last resort, look for any placeholder with a text frame that isn't the title
         for shape in slide.placeholders:
-            if shape != slide.shapes.title and hasattr(shape, 'has_text_frame') and shape.has_text_frame:
+            if shape != title_shape and hasattr(shape, 'has_text_frame') and shape.has_text_frame:
                 return shape
                 
         # If all else fails, look at all shapes
         for shape in slide.shapes:
-            if shape != slide.shapes.title and hasattr(shape, 'has_text_frame') and shape.has_text_frame:
+            if shape != title_shape and hasattr(shape, 'has_text_frame') and shape.has_text_frame:
                 return shape
                 
         return None
@@ -304,20 +345,18 @@ class PptTool(Tool):
         """Extract metadata from markdown content (if any)"""
         metadata = {}
         
-        # Check for metadata at the start of the document
-        lines = md_content.split('\n')
-        in_metadata = True
-        metadata_lines = []
+        # Metadata lives in the header block at the start of the document,
+        # so only look at the text before the first blank line
+        end = md_content.find('\n\n')
+        header = md_content if end == -1 else md_content[:end]
         
-        for line in lines:
-            if line.strip() == "" and in_metadata:
-                in_metadata = False
+        for line in header.split('\n'):
+            if line.strip() == "":
                 break
             
-            if in_metadata and ":" in line:
-                key, value = line.split(":", 1)
+            key, sep, value = line.partition(":")
+            if sep:
                 metadata[key.strip().lower()] = value.strip()
-                metadata_lines.append(line)
         
         return metadata
     
@@ -327,59 +366,10 @@ class PptTool(Tool):
             metadata = {}
             
         # First create a title slide
-        title_slide_layout = prs.slide_layouts[0]  # Title slide layout
-        title_slide = prs.slides.add_slide(title_slide_layout)
-        
-        # Set the title
-        title_shape = title_slide.shapes.title
-        title_shape.text = presentation_title
-        
-        # Try to set subtitle if the slide has a subtitle placeholder
-        if len(title_slide.placeholders) > 1:
-            try:
-                subtitle = title_slide.placeholders[1]  # Index 1 is typically the subtitle
-                author = metadata.get("author", "")
-                date = metadata.get("date", "")
-                
-                if author and date:
-                    subtitle.text = f"{author} | {date}"
-                elif author:
-                    subtitle.text = author
-                elif date:
-                    subtitle.text = date
-            except (IndexError, KeyError):
-                pass
-        
-        # Find all tags that could be headings or content
-        all_elements = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'pre', 'code', 'table'])
-        
-        # Group elements by slide (h1/h2 tags create new slides)
-        slides_content = []
-        current_group = []
-        
-        for elem in all_elements:
-            if elem.name in ['h1', 'h2']:
-                # If we have a previous slide group, save it
-                if current_group:
-                    slides_content.append(current_group)
-                # Start a new slide group with this heading
-                current_group = [elem]
-            elif current_group:  # Add to current slide group if one exists
-                current_group.append(elem)
-            # If no current group exists yet, create one if this is a heading
-            elif elem.name in ['h3', 'h4', 'h5', 'h6']:
-                current_group = [elem]
-        
-        # Add the last slide group if it exists
-        if current_group:
-            slides_content.append(current_group)
+        self._build_title_slide(prs, presentation_title, metadata)
         
         # Create slides from the grouped content
-        for slide_elements in slides_content:
-            # Get the first element as heading
-            heading = slide_elements[0]
-            content = slide_elements[1:]
-            
+        for heading, content in self._iter_slide_groups(soup):
             # Determine slide layout based on heading level
             if heading.name == 'h1':
                 slide_layout = prs.slide_layouts[0]  # Title slide
@@ -402,32 +392,53 @@ class PptTool(Tool):
             
             # Add content, but only if there is some
             if content:
-                try:
-                    # Find a suitable content placeholder
-                    body_shape = self._find_body_shape(slide)
-                    
-                    if body_shape:
-                        self._add_content_to_slide(body_shape, content)
-                    else:
-                        # If no body placeholder found, create a textbox
-                        left = Inches(1)
-                        top = Inches(2)
-                        width = Inches(8)
-                        height = Inches(4)
-                        textbox = slide.shapes.add_textbox(left, top, width, height)
-                        self._add_content_to_slide(textbox, content)
-                        
-                except Exception as e:
-                    # If there's a problem, create a textbox and try again
-                    left = Inches(1)
-                    top = Inches(2)
-                    width = Inches(8)
-                    height = Inches(4)
-                    textbox = slide.shapes.add_textbox(left, top, width, height)
-                    self._add_content_to_slide(textbox, content)
+                self._add_content_to_slide(self._place_content(slide), content)
+    
+    def _iter_slide_groups(self, soup):
+        """Yield (heading, content) groups in a single pass over the HTML tree"""
+        current_group = []
+        
+        for elem in soup.descendants:
+            # Only tags that could be headings or content are of interest
+            if isinstance(elem, NavigableString) or elem.name not in _SLIDE_TAGS:
+                continue
+            
+            if elem.name in ('h1', 'h2'):
+                # h1/h2 tags start a new slide; flush the previous group
+                if current_group:
+                    yield current_group[0], current_group[1:]
+                current_group = [elem]
+            elif current_group:  # Add to current slide group if one exists
+                current_group.append(elem)
+            # If no current group exists yet, create one if this is a heading
+            elif elem.name in ('h3', 'h4', 'h5', 'h6'):
+                current_group = [elem]
+        
+        # Yield the last slide group if it exists
+        if current_group:
+            yield current_group[0], current_group[1:]
     
     def _get_placeholder(self, slide, placeholder_type):
         """Get a placeholder by type"""
+        # Slides created from the same layout share placeholder indices, so
+        # the type lookup only has to be done once per layout
+        layout = slide.slide_layout
+        key = (id(layout), placeholder_type)
+        if key not in self._layout_placeholder_idx:
+            layout_shape = self._scan_placeholders(layout, placeholder_type)
+            self._layout_placeholder_idx[key] = layout_shape.placeholder_format.idx if layout_shape else None
+        
+        idx = self._layout_placeholder_idx[key]
+        if idx is None:
+            return None
+        try:
+            return slide.placeholders[idx]
+        except KeyError:
+            # Placeholder was removed from this slide; scan it instead
+            return self._scan_placeholders(slide, placeholder_type)
+    
+    def _scan_placeholders(self, slide, placeholder_type):
+        """Scan the placeholders of a slide or layout for the given type"""
         for shape in slide.placeholders:
             if shape.placeholder_format.type == placeholder_type:
                 return shape
@@ -439,93 +450,96 @@ class PptTool(Tool):
         text_frame.clear()  # Clear any existing text
         text_frame.word_wrap = True
         
-        # Process each content element
+        # Map each supported tag to the method that renders it
+        handlers = {
+            'p': self._add_paragraph_element,
+            'ul': self._add_list_element,
+            'ol': self._add_list_element,
+            'table': self._add_table_as_text,
+            'pre': self._add_code_element,
+            'code': self._add_code_element,
+            'h3': self._add_subheading_element,
+            'h4': self._add_subheading_element,
+            'h5': self._add_subheading_element,
+            'h6': self._add_subheading_element,
+        }
+        
+        # Process each content element (text nodes have no name and are skipped)
         for element in content_elements:
-            # Skip if it's just whitespace
-            if isinstance(element, NavigableString) and not element.strip():
-                continue
-                
-            # Handle different types of elements
-            if element.name == 'p':
-                p = text_frame.add_paragraph()
-                # Get text and remove extra whitespace
-                text_content = element.get_text().strip()
-                if text_content:
-                    p.text = text_content
-            
-            elif element.name in ['ul', 'ol']:
-                self._add_list_to_textframe(text_frame, element, is_ordered=element.name == 'ol')
-            
-            elif element.name == 'table':
-                # Convert table to text representation in PowerPoint
-                self._add_table_as_text(text_frame, element)
-            
-            elif element.name in ['pre', 'code']:
-                # Code blocks
-                p = text_frame.add_paragraph()
-                code_text = element.get_text().strip()
-                if code_text:
-                    p.text = code_text
-                    # Format as code (monospace font)
-                    for run in p.runs:
-                        run.font.name = 'Courier New'
-                        run.font.size = Pt(10)
-            
-            elif element.name in ['h3', 'h4', 'h5', 'h6']:
-                # Add subheadings within the slide with appropriate formatting
-                p = text_frame.add_paragraph()
-                text_content = element.get_text().strip()
-                if text_content:
-                    p.text = text_content
-                    # Format as subheading
-                    for run in p.runs:
-                        run.bold = True
-                        # Set size based on heading level
-                        if element.name == 'h3':
-                            run.font.size = Pt(18)
-                        elif element.name == 'h4':
-                            run.font.size = Pt(16)
-                        elif element.name == 'h5':
-                            run.font.size = Pt(14)
-                        elif element.name == 'h6':
-                            run.font.size = Pt(12)
+            handler = handlers.get(element.name)
+            if handler:
+                handler(text_frame, element)
+    
+    def _add_paragraph_element(self, text_frame, element):
+        """Add a paragraph element as plain text"""
+        p = text_frame.add_paragraph()
+        # Get text and remove extra whitespace
+        text_content = element.get_text().strip()
+        if text_content:
+            p.text = text_content
+    
+    def _add_list_element(self, text_frame, element):
+        """Add a top-level ul/ol element"""
+        self._add_list_to_textframe(text_frame, element, is_ordered=element.name == 'ol')
+    
+    def _add_code_element(self, text_frame, element):
+        """Add a code block in a monospace font"""
+        p = text_frame.add_paragraph()
+        code_text = element.get_text().strip()
+        if code_text:
+            p.text = code_text
+            # Format as code (monospace font)
+            for run in p.runs:
+                run.font.name = 'Courier New'
+                run.font.size = _CODE_FONT_SIZE
+    
+    def _add_subheading_element(self, text_frame, element):
+        """Add a subheading within the slide with formatting based on its level"""
+        p = text_frame.add_paragraph()
+        text_content = element.get_text().strip()
+        if text_content:
+            p.text = text_content
+            # Format as subheading
+            size = _SUBHEADING_SIZES[element.name]
+            for run in p.runs:
+                run.bold = True
+                run.font.size = size
     
     def _add_list_to_textframe(self, text_frame, list_element, is_ordered=False, level=0):
         """Add a list to a text frame with proper indentation"""
         # Get all list items at this level
         list_items = list_element.find_all('li', recursive=False)
         
-        for i, item in enumerate(list_items):
+        for item in list_items:
             # Create a new paragraph for this list item
             p = text_frame.add_paragraph()
             
-            # Extract text directly from this li element (not including nested lists)
+            # Extract text directly from this li element, collecting nested
+            # lists in the same pass
             text_parts = []
+            nested_lists = []
             for child in item.children:
                 if isinstance(child, NavigableString):
                     text_parts.append(child.strip())
-                elif child.name not in ['ul', 'ol']:  # Don't include nested lists
+                elif child.name in ('ul', 'ol'):
+                    nested_lists.append(child)
+                else:
                     text_parts.append(child.get_text().strip())
             
-            # Join text parts and set paragraph text
-            item_text = ' '.join(text_parts).strip()
+            # Join non-empty text parts and set paragraph text
+            item_text = ' '.join(filter(None, text_parts))
             
-            # For ordered lists, manually add the number at the beginning
-            if is_ordered:
-                p.text = f"{i+1}. {item_text}"
-            else:
-                # For unordered lists, we'll use PowerPoint's built-in bullet formatting
-                p.text = item_text
+            # Numbers and bullets both come from PowerPoint's built-in formatting
+            p.text = item_text
             
             # Set the indentation level
             p.level = level
             
             # Explicitly set paragraph as bullet point using direct XML manipulation
             # This ensures bullets appear correctly regardless of PPT template
-            self._ensure_bullet_formatting(p, is_ordered, i+1)
+            self._ensure_bullet_formatting(p, is_ordered)
             
             # Process any nested lists
-            nested_lists = item.find_all(['ul', 'ol'], recursive=False)
             for nested_list in nested_lists:
                 self._add_list_to_textframe(
                     text_frame, 
@@ -534,161 +548,34 @@ class PptTool(Tool):
                     level=level+1
                 )
     
-    def _ensure_bullet_formatting(self, paragraph, is_ordered=False, number=1):
+    def _ensure_bullet_formatting(self, paragraph, is_ordered=False):
         """Ensure bullet or numbering is applied to paragraph using direct XML approach"""
-        # We'll try multiple approaches in order of preference
-        try:
-            # First try the simplest approach: set the bullet property
-            self._set_bullet_property(paragraph, is_ordered)
-            return
-        except Exception as e:
-            pass
-            
-        try:
-            # Next try using the parse_xml approach
-            self._apply_bullet_via_parse_xml(paragraph, is_ordered)
-            return
-        except Exception as e:
-            pass
-            
-        try:
-            # Try direct XML manipulation if the above methods fail
-            self._apply_bullet_via_direct_xml(paragraph, is_ordered)
-            return
-        except Exception as e:
-            pass
-            
-        try:
-            # Final attempt: use raw XML string approach
-            self._apply_bullet_via_xml_string(paragraph, is_ordered)
-        except Exception as e:
-            # If all methods fail, we'll have to accept that bullets might not display
-            pass
-    
-    def _set_bullet_property(self, paragraph, is_ordered=False):
-        """Try to use the built-in python-pptx bullet property"""
-        try:
-            if hasattr(paragraph, 'bullet') and paragraph.bullet is not None:
-                paragraph.bullet.visible = True
-                if is_ordered:
-                    paragraph.bullet.number_style = 'arabicPeriod'
-                else:
-                    paragraph.bullet.character = '•'
-                return True
-        except:
-            return False
-    
-    def _apply_bullet_via_xml_string(self, paragraph, is_ordered=False):
-        """A last-resort method to set bullet formatting using string XML"""
-        # Get the internal lxml element
-        p_element = paragraph._element
-        
-        # Define the XML string for bullet points
-        if is_ordered:
-            xml_string = '<a:buAutoNum xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" type="arabicPeriod" startAt="1"/>'
-        else:
-            xml_string = '<a:buChar xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" char="•"/>'
-        
-        # Define the pPr element
-        pPr_string = '<a:pPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">' + xml_string + '</a:pPr>'
-        
-        # Import the lxml module within the function to handle the XML
-        from lxml import etree
-        
-        # Remove any existing pPr element
-        for child in list(p_element):
-            if child.tag.endswith('pPr'):
-                p_element.remove(child)
-        
-        # Create and add the new pPr element with bullet formatting
-        parser = etree.XMLParser(remove_blank_text=True)
-        new_pPr = etree.fromstring(pPr_string, parser)
-        p_element.insert(0, new_pPr)
-    
-    def _apply_bullet_via_parse_xml(self, paragraph, is_ordered=False):
-        """Apply bullet or numbering via parse_xml method"""
-        from pptx.oxml import parse_xml
-        
-        # Get paragraph properties element
         pPr = paragraph._p.get_or_add_pPr()
         
-        # First, remove any existing bullet properties that might conflict
-        for tag in ['{*}buNone', '{*}buChar', '{*}buAutoNum']:
-            for element in pPr.findall(f'.//{tag}'):
-                if element.getparent() is not None:
-                    element.getparent().remove(element)
+        # Remove any existing bullet properties that might conflict
+        for child in list(pPr):
+            if child.tag in _BULLET_TAGS:
+                pPr.remove(child)
         
         if is_ordered:
             # Add auto-numbering for ordered lists
-            buAutoNum = parse_xml(f'<a:buAutoNum xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" type="arabicPeriod" startAt="1"/>')
-            pPr.append(buAutoNum)
+            bullet = pPr.makeelement(_BU_AUTO_NUM_TAG, {'type': 'arabicPeriod', 'startAt': '1'})
         else:
             # Add bullet character for unordered lists
-            buChar = parse_xml(f'<a:buChar xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" char="•"/>')
-            pPr.append(buChar)
-    
-    def _apply_bullet_via_direct_xml(self, paragraph, is_ordered=False):
-        """Apply bullet via direct element creation (fallback method)"""
-        from lxml import etree
-        
-        # Define namespace map
-        nsmap = {
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-            'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
-        }
-        
-        # Get paragraph element
-        p_element = paragraph._p
+            bullet = pPr.makeelement(_BU_CHAR_TAG, {'char': '•'})
         
-        # Find existing pPr or create it
-        pPr = p_element.find('.//a:pPr', namespaces=nsmap)
-        if pPr is None:
-            # Need to create a new pPr element
-            if len(p_element) > 0 and p_element[0].tag.endswith('pPr'):
-                # Use existing one if it's there
-                pPr = p_element[0]
-            else:
-                # Create a new one - this is tricky with namespaces, so we'll use a tag with namespace
-                pPr = etree.Element('{{{0}}}pPr'.format(nsmap['a']))
-                # Insert at beginning
-                if len(p_element) > 0:
-                    p_element.insert(0, pPr)
-                else:
-                    p_element.append(pPr)
-        
-        # Remove any existing bullet elements using full namespace tags
-        for child in list(pPr):
-            tag = child.tag
-            if tag.endswith('buNone') or tag.endswith('buChar') or tag.endswith('buAutoNum'):
-                pPr.remove(child)
-        
-        # Create the appropriate bullet element with proper namespace
-        if is_ordered:
-            # For ordered list
-            buAutoNum = etree.Element('{{{0}}}buAutoNum'.format(nsmap['a']))
-            buAutoNum.set('type', 'arabicPeriod')
-            buAutoNum.set('startAt', '1')
-            pPr.append(buAutoNum)
-        else:
-            # For bullet list
-            buChar = etree.Element('{{{0}}}buChar'.format(nsmap['a']))
-            buChar.set('char', '•')
-            pPr.append(buChar)
-        
-        # Try setting bullet font as well 
-        buFont = etree.Element('{{{0}}}buFont'.format(nsmap['a']))
-        buFont.set('typeface', '+mj-lt')  # Default bullet font
-        pPr.append(buFont)
+        # Keep schema order: bullet elements come before tabLst/defRPr/extLst
+        pPr.insert_element_before(bullet, 'a:tabLst', 'a:defRPr', 'a:extLst')
     
     def _add_table_as_text(self, text_frame, table_element):
         """Convert HTML table to text representation"""
         # Get table rows
         rows = table_element.find_all('tr')
         
-        # Process headers if present
-        headers = table_element.find_all('th')
+        # Process headers if present (only the first row holds them)
+        headers = rows[0].find_all('th') if rows else []
         if headers:
-            header_text = ' | '.join([header.get_text().strip() for header in headers])
+            header_text = ' | '.join(header.get_text(separator=' ', strip=True) for header in headers)
             p = text_frame.add_paragraph()
             p.text = header_text
             
@@ -696,10 +583,13 @@ class PptTool(Tool):
             separator = '-' * len(header_text)
             p = text_frame.add_paragraph()
             p.text = separator
+            
+            # The header row has been emitted already
+            rows = rows[1:]
         
         # Process rows
         for row in rows:
             cells = row.find_all(['td', 'th'])
             if cells:
                 p = text_frame.add_paragraph()
-                p.text = ' | '.join([cell.get_text().strip() for cell in cells])
+                p.text = ' | '.join(cell.get_text(separator=' ', strip=True) for cell in cells)